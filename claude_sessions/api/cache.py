@@ -0,0 +1,70 @@
+"""Short-lived in-memory response cache for read-only API endpoints."""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from fastapi import Request, Response
+from pydantic_core import to_json
+
+# Upper bound on cached (path, query) entries; least recently used go first
+MAX_ENTRIES = 128
+
+_entries: "OrderedDict[Tuple[str, str], Tuple[float, str, bytes]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against our ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def cached_response(ttl: float) -> Callable:
+    """Cache an endpoint's JSON body for ``ttl`` seconds, keyed on path + query.
+
+    The wrapped endpoint must take a ``request: Request`` parameter. Every
+    response carries an ETag, and a matching If-None-Match gets a bare 304.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            key = (request.url.path, request.url.query)
+            now = time.monotonic()
+
+            with _lock:
+                entry = _entries.get(key)
+                if entry is not None and entry[0] > now:
+                    _entries.move_to_end(key)
+                else:
+                    entry = None
+
+            if entry is None:
+                result = await func(*args, **kwargs)
+                # Same encoder FastAPI uses for dict responses, so payloads match
+                body = to_json(result)
+                etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+                entry = (now + ttl, etag, body)
+                with _lock:
+                    _entries[key] = entry
+                    _entries.move_to_end(key)
+                    while len(_entries) > MAX_ENTRIES:
+                        _entries.popitem(last=False)
+
+            _, etag, body = entry
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and _etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            return Response(body, media_type="application/json", headers={"ETag": etag})
+
+        return wrapper
+
+    return decorator
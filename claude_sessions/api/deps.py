@@ -0,0 +1,26 @@
+"""FastAPI dependencies for the services shared through ``app.state``.
+
+main.py creates one instance of each service and publishes it on the app,
+so API routes and HTML pages read from the same parsers and caches.
+"""
+
+from fastapi import Request
+
+from ..data import ActiveSessionDetector, ArtifactParser, SessionParser
+from ..services.context_generator import ContextGenerator
+
+
+def get_parser(request: Request) -> SessionParser:
+    return request.app.state.parser
+
+
+def get_detector(request: Request) -> ActiveSessionDetector:
+    return request.app.state.detector
+
+
+def get_artifact_parser(request: Request) -> ArtifactParser:
+    return request.app.state.artifact_parser
+
+
+def get_context_generator(request: Request) -> ContextGenerator:
+    return request.app.state.context_gen
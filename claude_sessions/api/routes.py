@@ -1,82 +1,122 @@
-from fastapi import APIRouter, Query, HTTPException
-from typing import Optional, List
-
-from ..data import SessionParser, ActiveSessionDetector, SessionMetadata, ArtifactParser
+import functools
+
+import anyio
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from pydantic import TypeAdapter
+from typing import Any, Callable, Optional, List
+
+from ..data import (
+    SessionParser, ActiveSessionDetector, SessionMetadata, ArtifactParser,
+    ConversationMessage, Artifact,
+)
+from ..config import settings
+from ..data.models import TodoItem
 from ..services.context_generator import ContextGenerator
+from .cache import cached_response
+from .deps import get_artifact_parser, get_context_generator, get_detector, get_parser
 
 router = APIRouter(prefix="/api")
 
-# Initialize services
-parser = SessionParser()
-detector = ActiveSessionDetector()
-artifact_parser = ArtifactParser()
-context_gen = ContextGenerator(parser, detector)
+# Serialize whole lists in one call instead of model_dump() per item
+_SESSION_LIST = TypeAdapter(List[SessionMetadata])
+_MESSAGE_LIST = TypeAdapter(List[ConversationMessage])
+_ARTIFACT_LIST = TypeAdapter(List[Artifact])
+_TODO_LIST = TypeAdapter(List[TodoItem])
+
+# Created on first use so it binds to the running event loop
+_disk_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+async def _run_blocking(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking parser/detector call in a worker thread.
+
+    Keeps the event loop free for other requests while capping concurrent
+    disk scans at ``settings.max_concurrent_scans``.
+    """
+    global _disk_limiter
+    if _disk_limiter is None:
+        _disk_limiter = anyio.CapacityLimiter(settings.max_concurrent_scans)
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_disk_limiter
+    )
 
 
 @router.get("/sessions")
+@cached_response(ttl=2.0)
 async def list_sessions(
+    request: Request,
     limit: int = Query(50, le=200),
     offset: int = 0,
     active_only: bool = False,
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
 ) -> dict:
     """List all sessions with pagination."""
-    sessions = parser.get_all_sessions()
-    active_ids = set(detector.get_active_sessions())
-
-    # Mark active sessions
-    for session in sessions:
-        session.is_active = session.session_id in active_ids
+    active_ids = await _run_blocking(detector.get_active_sessions_set)
 
-    # Filter if needed
     if active_only:
-        sessions = [s for s in sessions if s.is_active]
+        # Only active sessions can match, so look them up directly
+        sessions = await _run_blocking(
+            lambda: [s for s in map(parser.get_session, active_ids) if s]
+        )
+        sessions.sort(key=lambda s: s.last_activity, reverse=True)
+        total = len(sessions)
+        sessions = sessions[offset : offset + limit]
+    else:
+        sessions, total = await _run_blocking(parser.get_sessions_page, offset, limit)
 
-    total = len(sessions)
-    sessions = sessions[offset : offset + limit]
+    # Mark active sessions on the returned page only
+    for session in sessions:
+        session.is_active = session.session_id in active_ids
 
     return {
-        "sessions": [s.model_dump() for s in sessions],
+        "sessions": _SESSION_LIST.dump_python(sessions),
         "total": total,
         "active_count": len(active_ids),
     }
 
 
 @router.get("/sessions/active")
-async def list_active_sessions() -> dict:
+async def list_active_sessions(
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
+) -> dict:
     """List currently active sessions."""
-    active_ids = detector.get_active_sessions()
-    latest_id = detector.get_latest_session_id()
+    active_ids, latest_id = await _run_blocking(detector.snapshot)
 
-    sessions = []
-    for session_id in active_ids:
-        session = parser.get_session(session_id)
-        if session:
-            session.is_active = True
-            sessions.append(session)
+    sessions = await _run_blocking(
+        lambda: [s for s in map(parser.get_session, active_ids) if s]
+    )
+    for session in sessions:
+        session.is_active = True
 
     # Sort by last activity
     sessions.sort(key=lambda s: s.last_activity, reverse=True)
 
     return {
-        "sessions": [s.model_dump() for s in sessions],
+        "sessions": _SESSION_LIST.dump_python(sessions),
         "latest_session_id": latest_id,
         "count": len(sessions),
     }
 
 
 @router.get("/sessions/{session_id}")
-async def get_session(session_id: str) -> dict:
+async def get_session(
+    session_id: str,
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
+) -> dict:
     """Get detailed session metadata."""
-    session = parser.get_session(session_id)
+    session = await _run_blocking(parser.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session.is_active = detector.is_session_active(session_id)
-    todos = parser.get_session_todos(session_id)
+    session.is_active = await _run_blocking(detector.is_session_active, session_id)
+    todos = await _run_blocking(parser.get_session_todos, session_id)
 
     return {
         "session": session.model_dump(),
-        "todos": [t.model_dump() for t in todos],
+        "todos": _TODO_LIST.dump_python(todos),
     }
 
 
@@ -85,17 +125,20 @@ async def get_session_messages(
     session_id: str,
     limit: int = Query(100, le=500),
     offset: int = 0,
+    parser: SessionParser = Depends(get_parser),
 ) -> dict:
     """Get conversation messages for a session."""
-    session = parser.get_session(session_id)
+    session = await _run_blocking(parser.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    messages = parser.get_session_messages(session_id, limit=limit, offset=offset)
+    messages = await _run_blocking(
+        parser.get_session_messages, session_id, limit=limit, offset=offset
+    )
     total = session.user_message_count + session.assistant_message_count
 
     return {
-        "messages": [m.model_dump() for m in messages],
+        "messages": _MESSAGE_LIST.dump_python(messages),
         "total": total,
         "has_more": offset + len(messages) < total,
     }
@@ -107,13 +150,16 @@ async def generate_context(
     include_files: bool = True,
     include_todos: bool = True,
     max_messages: int = 10,
+    parser: SessionParser = Depends(get_parser),
+    context_gen: ContextGenerator = Depends(get_context_generator),
 ) -> dict:
     """Generate a context prompt for continuing a session."""
-    session = parser.get_session(session_id)
+    session = await _run_blocking(parser.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    context = context_gen.generate_context(
+    context = await _run_blocking(
+        context_gen.generate_context,
         session_id,
         include_files=include_files,
         include_todos=include_todos,
@@ -124,10 +170,15 @@ async def generate_context(
 
 
 @router.get("/stats")
-async def get_stats() -> dict:
+@cached_response(ttl=5.0)
+async def get_stats(
+    request: Request,
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
+) -> dict:
     """Get aggregated usage statistics."""
-    stats = parser.get_stats()
-    active_count = len(detector.get_active_sessions())
+    stats = await _run_blocking(parser.get_stats)
+    active_count = len(await _run_blocking(detector.get_active_sessions_set))
     stats.active_sessions = active_count
     return stats.model_dump()
 
@@ -136,17 +187,32 @@ async def get_stats() -> dict:
 async def search_sessions(
     q: str = Query(..., min_length=2),
     search_content: bool = False,
+    limit: int = Query(50, le=200),
+    offset: int = 0,
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
 ) -> dict:
     """Search sessions by content or metadata."""
-    results = parser.search_sessions(q, search_content=search_content)
-    active_ids = set(detector.get_active_sessions())
+    # Ask for one extra match to learn whether another page exists
+    results = await _run_blocking(
+        parser.search_sessions,
+        q,
+        search_content=search_content,
+        limit=limit + 1,
+        offset=offset,
+    )
+    has_more = len(results) > limit
+    results = results[:limit]
+    active_ids = await _run_blocking(detector.get_active_sessions_set)
 
+    # Mark active sessions on the returned page only
     for session in results:
         session.is_active = session.session_id in active_ids
 
     return {
-        "results": [s.model_dump() for s in results],
-        "total": len(results),
+        "results": _SESSION_LIST.dump_python(results),
+        "count": len(results),
+        "has_more": has_more,
         "query": q,
     }
 
@@ -157,14 +223,16 @@ async def search_sessions(
 @router.get("/viz/sessions")
 async def viz_sessions_data(
     limit: int = Query(200, le=500),
+    parser: SessionParser = Depends(get_parser),
+    detector: ActiveSessionDetector = Depends(get_detector),
 ) -> dict:
     """Session data shaped for visualizations (terrain + scatter)."""
     from ..services.insights import calculate_session_cost
-    sessions = parser.get_all_sessions()
-    active_ids = set(detector.get_active_sessions())
+    sessions = await _run_blocking(parser.top_k_by_activity, limit)
+    active_ids = await _run_blocking(detector.get_active_sessions_set)
 
     data = []
-    for s in sessions[:limit]:
+    for s in sessions:
         cost = calculate_session_cost(s)
         duration_min = (s.last_activity - s.start_time).total_seconds() / 60
         data.append({
@@ -196,36 +264,44 @@ async def list_artifacts(
     limit: int = Query(100, le=500),
     file_type: Optional[str] = None,
     session_id: Optional[str] = None,
+    artifact_parser: ArtifactParser = Depends(get_artifact_parser),
 ) -> dict:
     """List all artifacts (files created/modified by Claude)."""
     if session_id:
-        artifacts = artifact_parser.get_session_artifacts(session_id)
+        artifacts = await _run_blocking(
+            artifact_parser.get_session_artifacts, session_id
+        )
     else:
-        artifacts = artifact_parser.get_all_artifacts(limit=limit)
+        artifacts = await _run_blocking(artifact_parser.get_all_artifacts, limit=limit)
 
     if file_type:
         artifacts = [a for a in artifacts if a.file_type == file_type]
 
     return {
-        "artifacts": [a.model_dump() for a in artifacts],
+        "artifacts": _ARTIFACT_LIST.dump_python(artifacts),
         "total": len(artifacts),
     }
 
 
 @router.get("/artifacts/stats")
-async def get_artifact_stats() -> dict:
+async def get_artifact_stats(
+    artifact_parser: ArtifactParser = Depends(get_artifact_parser),
+) -> dict:
     """Get artifact statistics."""
-    return artifact_parser.get_artifact_stats()
+    return await _run_blocking(artifact_parser.get_artifact_stats)
 
 
 @router.get("/sessions/{session_id}/topics")
-async def get_session_topics(session_id: str) -> dict:
+async def get_session_topics(
+    session_id: str,
+    parser: SessionParser = Depends(get_parser),
+) -> dict:
     """Extract topic blocks from a session."""
     from ..services.topic_extractor import extract_topic_blocks
-    session = parser.get_session(session_id)
+    session = await _run_blocking(parser.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    blocks = extract_topic_blocks(session_id, parser)
+    blocks = await _run_blocking(extract_topic_blocks, session_id, parser)
     return {
         "session_id": session_id,
         "topics": [b.to_dict() for b in blocks],
@@ -240,6 +316,12 @@ async def search_messages(
 ) -> dict:
     """Message-level search — returns individual messages matching the query,
     with session context and deep-link UUIDs."""
+    results = await _run_blocking(_search_messages, q, limit)
+    return {"results": results[:limit], "total": len(results), "query": q}
+
+
+def _search_messages(q: str, limit: int) -> List[dict]:
+    """Search the live index and the archive, deduplicated by message UUID."""
     from ..data.search_index import SearchIndex
     from ..data.archive import SessionArchive
     idx = SearchIndex()
@@ -252,20 +334,24 @@ async def search_messages(
         if ar["message_uuid"] not in seen:
             results.append(ar)
             seen.add(ar["message_uuid"])
-    return {"results": results[:limit], "total": len(results), "query": q}
+    return results
 
 
 @router.get("/sessions/{session_id}/artifacts")
-async def get_session_artifacts(session_id: str) -> dict:
+async def get_session_artifacts(
+    session_id: str,
+    parser: SessionParser = Depends(get_parser),
+    artifact_parser: ArtifactParser = Depends(get_artifact_parser),
+) -> dict:
     """Get artifacts for a specific session."""
-    session = parser.get_session(session_id)
+    session = await _run_blocking(parser.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    artifacts = artifact_parser.get_session_artifacts(session_id)
+    artifacts = await _run_blocking(artifact_parser.get_session_artifacts, session_id)
 
     return {
-        "artifacts": [a.model_dump() for a in artifacts],
+        "artifacts": _ARTIFACT_LIST.dump_python(artifacts),
         "total": len(artifacts),
         "session_id": session_id,
     }
@@ -14,6 +14,12 @@ class Settings(BaseSettings):
     # Active session detection threshold (minutes)
     active_threshold_minutes: int = 5
 
+    # How long active-session scans are reused before rescanning (seconds)
+    active_cache_ttl_seconds: float = 2.0
+
+    # Max blocking disk scans the API runs in worker threads at once
+    max_concurrent_scans: int = 4
+
     # Pagination defaults
     default_page_size: int = 50
     max_page_size: int = 200
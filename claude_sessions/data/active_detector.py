@@ -1,12 +1,39 @@
+import os
 import re
 import subprocess
-from datetime import datetime, timedelta
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from ..config import settings
 
 
+def _recently_modified(
+    directory: Path, suffix: str, cutoff_ts: float, skip_symlinks: bool = False
+) -> Iterator[str]:
+    """Yield stems of files in a directory modified after a Unix timestamp.
+
+    One os.scandir pass: name and symlink checks come from the directory
+    read itself, so only matching files cost a stat() call.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(suffix):
+                    continue
+                try:
+                    if skip_symlinks and entry.is_symlink():
+                        continue
+                    if entry.stat().st_mtime > cutoff_ts:
+                        yield name[: -len(suffix)]
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
 class ActiveSessionDetector:
     """Detect currently active Claude Code sessions.
 
@@ -22,8 +49,41 @@ class ActiveSessionDetector:
         self.debug_dir = self.claude_dir / "debug"
         self.threshold_minutes = settings.active_threshold_minutes
 
+        # Short-lived cache so bursts of requests share one scan. Entries are
+        # also dropped early when debug/ changes (a new session's debug file
+        # or a repointed `latest` symlink bumps the directory mtime).
+        self._cache_ttl = settings.active_cache_ttl_seconds
+        self._cache: Optional[FrozenSet[str]] = None
+        self._cache_ts = 0.0
+        self._cache_dir_mtime: Optional[int] = None
+        self._latest_cache: Optional[Tuple[float, Optional[int], Optional[str]]] = None
+        self._lock = threading.Lock()
+
+    def _debug_dir_mtime(self) -> Optional[int]:
+        """Modification time of the debug directory, or None if missing."""
+        try:
+            return os.stat(self.debug_dir).st_mtime_ns
+        except OSError:
+            return None
+
     def get_latest_session_id(self) -> Optional[str]:
         """Get the session ID from the debug/latest symlink."""
+        cached = self._latest_cache
+        now = time.monotonic()
+        dir_mtime = self._debug_dir_mtime()
+        if (
+            cached is not None
+            and cached[1] == dir_mtime
+            and now - cached[0] < self._cache_ttl
+        ):
+            return cached[2]
+
+        latest_id = self._read_latest_session_id()
+        self._latest_cache = (now, dir_mtime, latest_id)
+        return latest_id
+
+    def _read_latest_session_id(self) -> Optional[str]:
+        """Resolve the debug/latest symlink to a session ID."""
         latest = self.debug_dir / "latest"
         if latest.exists() and latest.is_symlink():
             try:
@@ -35,23 +95,49 @@ class ActiveSessionDetector:
 
     def get_active_sessions(self) -> List[str]:
         """Get list of currently active session IDs."""
+        return list(self.get_active_sessions_set())
+
+    def get_active_sessions_set(self) -> FrozenSet[str]:
+        """Get the set of currently active session IDs.
+
+        Results are reused for ``active_cache_ttl_seconds`` unless the debug
+        directory changed in the meantime; concurrent callers wait on the
+        lock and share a single scan.
+        """
+        with self._lock:
+            dir_mtime = self._debug_dir_mtime()
+            if (
+                self._cache is not None
+                and dir_mtime == self._cache_dir_mtime
+                and time.monotonic() - self._cache_ts < self._cache_ttl
+            ):
+                return self._cache
+
+            active = frozenset(self._scan_active_sessions())
+            self._cache = active
+            self._cache_ts = time.monotonic()
+            self._cache_dir_mtime = dir_mtime
+            return active
+
+    def snapshot(self) -> Tuple[FrozenSet[str], Optional[str]]:
+        """Get (active session IDs, latest session ID) from the cached scan."""
+        return self.get_active_sessions_set(), self.get_latest_session_id()
+
+    def _scan_active_sessions(self) -> Set[str]:
+        """Scan JSONL files, processes and debug files for active sessions."""
         active: Set[str] = set()
-        cutoff = datetime.now() - timedelta(minutes=self.threshold_minutes)
+        cutoff_ts = time.time() - self.threshold_minutes * 60
 
         # 1. Check JSONL files modified recently (most reliable signal)
-        if self.projects_dir.exists():
-            for project_dir in self.projects_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                for jsonl in project_dir.glob("*.jsonl"):
-                    if jsonl.stem.startswith("agent-"):
-                        continue
-                    try:
-                        mtime = datetime.fromtimestamp(jsonl.stat().st_mtime)
-                        if mtime > cutoff:
-                            active.add(jsonl.stem)
-                    except Exception:
-                        continue
+        try:
+            with os.scandir(self.projects_dir) as projects:
+                project_dirs = [e.path for e in projects if e.is_dir()]
+        except OSError:
+            project_dirs = []
+        for project_dir in project_dirs:
+            for stem in _recently_modified(project_dir, ".jsonl", cutoff_ts):
+                if not stem.startswith("agent-"):
+                    active.add(stem)
 
         # 2. Check running claude processes — catches all terminals including minimized
         try:
@@ -123,41 +209,29 @@ class ActiveSessionDetector:
                                 # Check if any JSONL in this project dir was written recently
                                 cwd_encoded = cwd_path.replace("/", "-").lstrip("-")
                                 project_dir = self.projects_dir / cwd_encoded
-                                if project_dir.exists():
-                                    for jsonl in project_dir.glob("*.jsonl"):
-                                        if jsonl.stem.startswith("agent-"):
-                                            continue
-                                        try:
-                                            mtime = datetime.fromtimestamp(jsonl.stat().st_mtime)
-                                            # Use a wider window (30 min) for process-backed sessions
-                                            if mtime > datetime.now() - timedelta(minutes=30):
-                                                active.add(jsonl.stem)
-                                        except Exception:
-                                            continue
+                                # Use a wider window (30 min) for process-backed sessions
+                                for stem in _recently_modified(
+                                    project_dir, ".jsonl", time.time() - 30 * 60
+                                ):
+                                    if not stem.startswith("agent-"):
+                                        active.add(stem)
                     except Exception:
                         continue
         except Exception:
             pass
 
         # 3. Legacy: debug file modification time
-        if self.debug_dir.exists():
-            for debug_file in self.debug_dir.glob("*.txt"):
-                if debug_file.is_symlink():
-                    continue
-                try:
-                    mtime = datetime.fromtimestamp(debug_file.stat().st_mtime)
-                    if mtime > cutoff:
-                        active.add(debug_file.stem)
-                except Exception:
-                    continue
+        active.update(
+            _recently_modified(self.debug_dir, ".txt", cutoff_ts, skip_symlinks=True)
+        )
 
         # 4. Include the latest session
         latest = self.get_latest_session_id()
         if latest:
             active.add(latest)
 
-        return list(active)
+        return active
 
     def is_session_active(self, session_id: str) -> bool:
         """Check if a specific session is currently active."""
-        return session_id in set(self.get_active_sessions())
+        return session_id in self.get_active_sessions_set()
@@ -1,11 +1,112 @@
-import json
+import codecs
+import heapq
 import mimetypes
+import os
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 
 from ..config import settings
+from . import jsonl
 from .models import Artifact
+from .session_files import SessionFileIndex, scan_session_files
+
+
+_TYPE_MAP = {
+    # Code
+    ".py": "code",
+    ".js": "code",
+    ".ts": "code",
+    ".tsx": "code",
+    ".jsx": "code",
+    ".java": "code",
+    ".go": "code",
+    ".rs": "code",
+    ".c": "code",
+    ".cpp": "code",
+    ".h": "code",
+    ".rb": "code",
+    ".php": "code",
+    ".swift": "code",
+    ".kt": "code",
+    ".scala": "code",
+    ".r": "code",
+    # Web
+    ".html": "web",
+    ".css": "web",
+    ".scss": "web",
+    ".less": "web",
+    ".vue": "web",
+    ".svelte": "web",
+    # Config
+    ".json": "config",
+    ".yaml": "config",
+    ".yml": "config",
+    ".toml": "config",
+    ".ini": "config",
+    ".env": "config",
+    ".xml": "config",
+    ".plist": "config",
+    # Documents
+    ".md": "document",
+    ".txt": "document",
+    ".rst": "document",
+    ".org": "document",
+    # Shell
+    ".sh": "shell",
+    ".bash": "shell",
+    ".zsh": "shell",
+    ".fish": "shell",
+    # Data
+    ".csv": "data",
+    ".sql": "data",
+    ".db": "data",
+    # Images
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".gif": "image",
+    ".svg": "image",
+    ".webp": "image",
+}
+
+# Load the system mime.types files once at import rather than on the first
+# artifact lookup, and snapshot the extension table so lookups are a dict get.
+mimetypes.init()
+_EXT_TO_MIME = {
+    ext: mime for ext, mime in mimetypes.types_map.items() if ext == ext.lower()
+}
+
+# Compression/alias suffixes (.gz, .tgz, ...) need guess_type's full logic
+_GUESS_EXTS = frozenset(
+    ext.lower() for ext in (*mimetypes.encodings_map, *mimetypes.suffix_map)
+)
+
+# How much of an artifact file get_artifact_content() returns
+PREVIEW_BYTES = 10000
+
+
+def _split_name(file_path: str) -> Tuple[str, str]:
+    """Return (file name, lowercased extension) without building a Path."""
+    name = file_path[file_path.rfind("/") + 1 :]
+    idx = name.rfind(".")
+    return name, name[idx:].lower() if 0 < idx < len(name) - 1 else ""
+
+
+def _keep_latest(latest: Dict[str, Artifact], artifacts: Iterable[Artifact]) -> None:
+    """Merge artifacts into a file_path -> most recent artifact map."""
+    for artifact in artifacts:
+        current = latest.get(artifact.file_path)
+        if current is None or artifact.timestamp >= current.timestamp:
+            latest[artifact.file_path] = artifact
+
+
+def _mime_type(file_path: str, ext: str) -> str:
+    """MIME type for a file, from the prebuilt extension table."""
+    if ext in _GUESS_EXTS:
+        return mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    return _EXT_TO_MIME.get(ext, "application/octet-stream")
 
 
 class ArtifactParser:
@@ -15,33 +116,28 @@ class ArtifactParser:
         self.claude_dir = claude_dir or settings.claude_data_dir
         self.projects_dir = self.claude_dir / "projects"
         self.file_history_dir = self.claude_dir / "file-history"
+        self._session_files = SessionFileIndex(self.projects_dir)
 
-    def get_all_artifacts(self, limit: int = 100) -> List[Artifact]:
-        """Get all artifacts across all sessions, sorted by recency."""
-        artifacts = []
-        seen_paths = {}  # Track latest version of each file
+        # session file -> (mtime_ns, size, parsed_offset, artifacts)
+        self._parse_cache: Dict[Path, Tuple[int, int, int, List[Artifact]]] = {}
 
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            for session_file in project_dir.glob("*.jsonl"):
-                if session_file.stem.startswith("agent-"):
-                    continue
+    def warmup(self) -> None:
+        """Build the session file index ahead of the first lookup."""
+        self._session_files.refresh()
 
-                session_id = session_file.stem
-                session_artifacts = self._parse_session_artifacts(
-                    session_file, session_id
-                )
+    def get_all_artifacts(self, limit: int = 100) -> List[Artifact]:
+        """Get all artifacts across all sessions, sorted by recency."""
+        seen_paths: Dict[str, Artifact] = {}  # Track latest version of each file
 
-                for artifact in session_artifacts:
-                    key = artifact.file_path
-                    if key not in seen_paths or artifact.timestamp > seen_paths[key].timestamp:
-                        seen_paths[key] = artifact
+        for session_id, file_path, _ in scan_session_files(self.projects_dir):
+            _keep_latest(
+                seen_paths, self._parse_session_artifacts(Path(file_path), session_id)
+            )
 
-        artifacts = list(seen_paths.values())
-        artifacts.sort(key=lambda a: a.timestamp, reverse=True)
-        return artifacts[:limit]
+        artifacts = heapq.nlargest(
+            limit, seen_paths.values(), key=attrgetter("timestamp")
+        )
+        return self._check_exists(artifacts)
 
     def get_session_artifacts(self, session_id: str) -> List[Artifact]:
         """Get all artifacts for a specific session."""
@@ -49,68 +145,95 @@ class ArtifactParser:
         if not session_file:
             return []
 
-        return self._parse_session_artifacts(session_file, session_id)
+        latest: Dict[str, Artifact] = {}
+        _keep_latest(latest, self._parse_session_artifacts(session_file, session_id))
+        return self._check_exists(list(latest.values()))
+
+    def _check_exists(self, artifacts: List[Artifact]) -> List[Artifact]:
+        """Set ``exists`` on each artifact, stat'ing every unique path once."""
+        existence = {p: os.path.exists(p) for p in {a.file_path for a in artifacts}}
+        for artifact in artifacts:
+            artifact.exists = existence[artifact.file_path]
+        return artifacts
 
     def _find_session_file(self, session_id: str) -> Optional[Path]:
         """Find the session file for a given session ID."""
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            session_file = project_dir / f"{session_id}.jsonl"
-            if session_file.exists():
-                return session_file
-        return None
+        return self._session_files.find(session_id)
 
     def _parse_session_artifacts(
         self, session_file: Path, session_id: str
     ) -> List[Artifact]:
-        """Parse artifacts from a session JSONL file."""
-        artifacts = []
-        seen = set()
-
-        with open(session_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        """Parse artifacts from a session JSONL file, cached per (mtime, size)."""
+        try:
+            st = session_file.stat()
+        except OSError:
+            return []
+
+        cached = self._parse_cache.get(session_file)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return list(cached[3])
+
+        if cached and st.st_size > cached[1]:
+            offset, artifacts = cached[2], list(cached[3])
+        else:
+            offset, artifacts = 0, []
+
+        with open(session_file, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                # Most lines are plain conversation text. Skip the JSON decode
+                # unless the line can contain a file operation at all.
+                if b'"toolUseResult"' not in raw and b'"tool_use"' not in raw:
+                    if not raw.endswith(b"\n"):
+                        break  # may be a half-written line; re-check next time
+                    offset += len(raw)
                     continue
 
                 try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
+                    obj = jsonl.loads(raw)
+                except jsonl.JSONDecodeError:
+                    if not raw.endswith(b"\n"):
+                        # Trailing line still being written — retry next time
+                        break
+                    offset += len(raw)  # blank or corrupt line
                     continue
+                offset += len(raw)
+                get = obj.get
+
+                # Decoded JSON only yields plain types, so type() checks suffice
 
                 # Check for toolUseResult with file operations
-                tool_result = obj.get("toolUseResult")
-                if tool_result and isinstance(tool_result, dict):
-                    file_path = tool_result.get("filePath")
-                    if file_path and file_path not in seen:
-                        seen.add(file_path)
-                        artifact = self._create_artifact_from_tool_result(
-                            tool_result, obj, session_id
+                tool_result = get("toolUseResult")
+                if type(tool_result) is dict and tool_result:
+                    artifact = self._create_artifact_from_tool_result(
+                        tool_result, obj, session_id
+                    )
+                    if artifact:
+                        artifacts.append(artifact)
+
+                # Also check for tool_use in assistant messages (for context)
+                message = get("message")
+                content = message.get("content") if type(message) is dict else None
+                if type(content) is not list:
+                    continue
+                for block in content:
+                    if type(block) is not dict or block.get("type") != "tool_use":
+                        continue
+                    tool_name = block.get("name", "")
+                    if tool_name not in ("Write", "Edit"):
+                        continue
+                    tool_input = block.get("input")
+                    if type(tool_input) is dict:
+                        artifact = self._create_artifact_from_tool_use(
+                            tool_name, tool_input, obj, session_id
                         )
                         if artifact:
                             artifacts.append(artifact)
 
-                # Also check for tool_use in assistant messages (for context)
-                message = obj.get("message", {})
-                content = message.get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            tool_input = block.get("input", {})
-
-                            if tool_name in ("Write", "Edit") and isinstance(tool_input, dict):
-                                file_path = tool_input.get("file_path")
-                                if file_path and file_path not in seen:
-                                    seen.add(file_path)
-                                    artifact = self._create_artifact_from_tool_use(
-                                        tool_name, tool_input, obj, session_id
-                                    )
-                                    if artifact:
-                                        artifacts.append(artifact)
-
-        return artifacts
+        self._parse_cache[session_file] = (
+            st.st_mtime_ns, st.st_size, offset, artifacts
+        )
+        return list(artifacts)
 
     def _create_artifact_from_tool_result(
         self, tool_result: Dict[str, Any], obj: Dict[str, Any], session_id: str
@@ -129,16 +252,16 @@ class ArtifactParser:
         except (ValueError, AttributeError):
             timestamp = datetime.now()
 
+        file_name, ext = _split_name(file_path)
         return Artifact(
             file_path=file_path,
-            file_name=Path(file_path).name,
-            file_type=self._get_file_type(file_path),
+            file_name=file_name,
+            file_type=_TYPE_MAP.get(ext, "other"),
             operation=operation,
             session_id=session_id,
             timestamp=timestamp,
             size_bytes=len(content) if content else 0,
-            mime_type=self._get_mime_type(file_path),
-            exists=Path(file_path).exists(),
+            mime_type=_mime_type(file_path, ext),
         )
 
     def _create_artifact_from_tool_use(
@@ -162,100 +285,39 @@ class ArtifactParser:
         except (ValueError, AttributeError):
             timestamp = datetime.now()
 
+        file_name, ext = _split_name(file_path)
         return Artifact(
             file_path=file_path,
-            file_name=Path(file_path).name,
-            file_type=self._get_file_type(file_path),
+            file_name=file_name,
+            file_type=_TYPE_MAP.get(ext, "other"),
             operation=operation,
             session_id=session_id,
             timestamp=timestamp,
             size_bytes=len(content) if content else 0,
-            mime_type=self._get_mime_type(file_path),
-            exists=Path(file_path).exists(),
+            mime_type=_mime_type(file_path, ext),
         )
 
     def _get_file_type(self, file_path: str) -> str:
         """Determine the file type category."""
-        ext = Path(file_path).suffix.lower()
-
-        type_map = {
-            # Code
-            ".py": "code",
-            ".js": "code",
-            ".ts": "code",
-            ".tsx": "code",
-            ".jsx": "code",
-            ".java": "code",
-            ".go": "code",
-            ".rs": "code",
-            ".c": "code",
-            ".cpp": "code",
-            ".h": "code",
-            ".rb": "code",
-            ".php": "code",
-            ".swift": "code",
-            ".kt": "code",
-            ".scala": "code",
-            ".r": "code",
-            # Web
-            ".html": "web",
-            ".css": "web",
-            ".scss": "web",
-            ".less": "web",
-            ".vue": "web",
-            ".svelte": "web",
-            # Config
-            ".json": "config",
-            ".yaml": "config",
-            ".yml": "config",
-            ".toml": "config",
-            ".ini": "config",
-            ".env": "config",
-            ".xml": "config",
-            ".plist": "config",
-            # Documents
-            ".md": "document",
-            ".txt": "document",
-            ".rst": "document",
-            ".org": "document",
-            # Shell
-            ".sh": "shell",
-            ".bash": "shell",
-            ".zsh": "shell",
-            ".fish": "shell",
-            # Data
-            ".csv": "data",
-            ".sql": "data",
-            ".db": "data",
-            # Images
-            ".png": "image",
-            ".jpg": "image",
-            ".jpeg": "image",
-            ".gif": "image",
-            ".svg": "image",
-            ".webp": "image",
-        }
-
-        return type_map.get(ext, "other")
-
-    def _get_mime_type(self, file_path: str) -> str:
-        """Get the MIME type for a file."""
-        mime_type, _ = mimetypes.guess_type(file_path)
-        return mime_type or "application/octet-stream"
+        return _TYPE_MAP.get(_split_name(file_path)[1], "other")
 
     def get_artifact_content(self, file_path: str) -> Optional[str]:
-        """Get the current content of an artifact file."""
-        path = Path(file_path)
-        if not path.exists():
+        """Get the current content of an artifact file (first 10KB)."""
+        # Only read text files
+        if self._get_file_type(file_path) in ("image", "data"):
             return None
 
         try:
-            # Only read text files
-            if self._get_file_type(file_path) in ("image", "data"):
-                return None
-            return path.read_text()[:10000]  # Limit to 10KB
-        except Exception:
+            with open(file_path, "rb") as f:
+                data = f.read(PREVIEW_BYTES)
+        except OSError:
+            return None
+
+        # A NUL byte near the start means binary; don't try to decode it
+        if b"\0" in data[:1024]:
             return None
+        # Non-final decode drops a multi-byte character cut off at the limit
+        return codecs.getincrementaldecoder("utf-8")("replace").decode(data)
 
     def get_artifact_stats(self) -> Dict[str, Any]:
         """Get aggregate statistics about artifacts."""
@@ -0,0 +1,70 @@
+"""JSON decoding for Claude Code's JSONL session files.
+
+Uses orjson when it is installed (several times faster on session-sized
+records) and falls back to the stdlib json module otherwise. Both accept
+``bytes`` directly and ignore the trailing newline of a JSONL line.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode one JSON document with orjson, falling back to json.
+
+        orjson rejects lone UTF-16 surrogate escapes such as ``"\\ud83d"``,
+        which Node writes when a string is cut mid-emoji; the stdlib decoder
+        accepts them, so such lines are retried there rather than dropped.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as exc:
+            try:
+                return json.loads(data)
+            except UnicodeDecodeError:
+                raise exc from None
+
+else:
+    loads = json.loads
+
+# Files at least this large are memory-mapped instead of read into one buffer
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def iter_lines(path: Union[str, Path]) -> Iterator[bytes]:
+    """Yield the non-empty lines of a JSONL file as bytes.
+
+    The file is read with a single read() and split, which avoids the
+    per-line overhead of iterating a file object. Files of MMAP_THRESHOLD
+    or more are memory-mapped and scanned for newlines instead, so they are
+    never copied into memory whole.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            for line in f.read().split(b"\n"):
+                if line:
+                    yield line
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                if end > start:
+                    yield mm[start:end]
+                start = end + 1
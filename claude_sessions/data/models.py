@@ -1,3 +1,5 @@
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Any
 from pydantic import BaseModel, Field
@@ -14,16 +16,21 @@ class ToolCallDetail(BaseModel):
     query: Optional[str] = None  # For search operations
 
 
-class ConversationMessage(BaseModel):
+# slots/kw_only need Python 3.10; older versions get a plain dataclass
+_MESSAGE_DATACLASS = {"slots": True, "kw_only": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_MESSAGE_DATACLASS)
+class ConversationMessage:
     """A single message in a conversation."""
 
     uuid: str
-    parent_uuid: Optional[str] = None
     type: str  # "user" | "assistant" | "summary"
     timestamp: datetime
     content: str  # Extracted text content
-    tool_calls: List[dict] = Field(default_factory=list)
-    tool_details: List[ToolCallDetail] = Field(default_factory=list)
+    parent_uuid: Optional[str] = None
+    tool_calls: List[dict] = field(default_factory=list)
+    tool_details: List[ToolCallDetail] = field(default_factory=list)
     thinking: Optional[str] = None
     model: Optional[str] = None
     token_usage: Optional[dict] = None
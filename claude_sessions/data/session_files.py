@@ -0,0 +1,77 @@
+"""Index of session JSONL files under ~/.claude/projects.
+
+Maps session IDs to their files with one os.scandir walk, so looking up a
+session doesn't probe every project directory.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+# How long a directory walk is trusted before rescanning (seconds)
+INDEX_TTL_SECONDS = 30.0
+
+# Minimum gap between rescans triggered by lookups of unknown IDs (seconds)
+MISS_RESCAN_SECONDS = 1.0
+
+
+def scan_session_files(projects_dir: Path) -> Iterator[Tuple[str, str, str]]:
+    """Yield (session_id, file_path, project_name) for every session JSONL.
+
+    Agent transcripts (``agent-*.jsonl``) are skipped. Filtering is done on
+    names from the directory read, so no per-file stat() is needed.
+    """
+    try:
+        with os.scandir(projects_dir) as projects:
+            project_entries = [e for e in projects if e.is_dir()]
+    except OSError:
+        return
+
+    for project in project_entries:
+        try:
+            with os.scandir(project.path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".jsonl") and not name.startswith("agent-"):
+                        yield name[:-6], entry.path, project.name
+        except OSError:
+            continue
+
+
+class SessionFileIndex:
+    """Lazily built session_id -> JSONL path map.
+
+    The map is rebuilt after INDEX_TTL_SECONDS, or sooner when a lookup
+    misses (a new session may have started since the last walk).
+    """
+
+    def __init__(self, projects_dir: Path, ttl: float = INDEX_TTL_SECONDS):
+        self.projects_dir = projects_dir
+        self.ttl = ttl
+        self._paths: Dict[str, Path] = {}
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Rebuild the index with a fresh directory walk."""
+        paths: Dict[str, Path] = {}
+        for session_id, file_path, _ in scan_session_files(self.projects_dir):
+            paths.setdefault(session_id, Path(file_path))
+        with self._lock:
+            self._paths = paths
+            self._built_at = time.monotonic()
+
+    def find(self, session_id: str) -> Optional[Path]:
+        """Return the JSONL path for a session ID, or None if unknown."""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at >= self.ttl:
+            self.refresh()
+            return self._paths.get(session_id)
+
+        path = self._paths.get(session_id)
+        if path is None and time.monotonic() - built_at >= MISS_RESCAN_SECONDS:
+            self.refresh()
+            path = self._paths.get(session_id)
+        return path
@@ -1,11 +1,21 @@
+import heapq
 import json
+import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Iterator, Dict, Any, Tuple
+from typing import Optional, List, Iterable, Iterator, Dict, Any, Set, Tuple
 
 from ..config import settings
+from . import jsonl
 from .models import SessionMetadata, ConversationMessage, SessionStats, TodoItem, ToolCallDetail, ConversationThread, ConversationTree
+from .session_files import SessionFileIndex, scan_session_files
 
 # Patterns that indicate pasted/external content
 PASTE_INDICATORS = [
@@ -22,6 +32,46 @@ PASTE_INDICATORS = [
     (r"sent:.*\n.*subject:", "email"),
 ]
 
+# Record types that become ConversationMessages
+_MESSAGE_TYPES = frozenset(("user", "assistant", "summary"))
+
+# Parsed sessions kept in memory for get_session_bundle()
+BUNDLE_CACHE_SIZE = 32
+
+# Parsed session metadata, reused across requests while a file is unchanged
+META_CACHE_SIZE = 4096
+
+# Where the metadata cache is saved between runs
+META_CACHE_PATH = settings.claude_data_dir / "session-meta-cache.json"
+
+# Bump when the saved file layout changes; SessionMetadata changes are caught
+# per entry when the cache is loaded
+META_CACHE_VERSION = 2
+
+# How long stats computed from sessions (no stats-cache.json) are reused
+STATS_TTL_SECONDS = 30.0
+
+# Memory budget for lowercased session files kept for content search (bytes)
+CONTENT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SessionBundle:
+    """Everything parsed from one session file, read in a single pass."""
+
+    metadata: Optional[SessionMetadata]
+    messages: Tuple[ConversationMessage, ...]
+    todos: Tuple[TodoItem, ...]
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 def _detect_pasted_content(text: str) -> List[str]:
     """Detect if a message contains pasted external content."""
@@ -41,6 +91,34 @@ def _detect_pasted_content(text: str) -> List[str]:
     return list(types)
 
 
+if sys.version_info >= (3, 11):
+    # Parses the "Z" suffix itself; no per-timestamp replace() copy needed
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a message's ISO-8601 timestamp, falling back to now()."""
+    if value:
+        try:
+            return _fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.now()
+
+
+def _is_utc_iso(value: Any, length: int) -> bool:
+    """True for a "YYYY-MM-DDTHH:MM:SS[.fff]Z" string of the given length."""
+    return (
+        type(value) is str
+        and len(value) == length
+        and value[-1:] == "Z"
+        and value[10:11] == "T"
+    )
+
+
 def _generate_title(first_message: str) -> str:
     """Generate a readable title from the first user message."""
     # Clean up the message
@@ -91,6 +169,14 @@ def _generate_title(first_message: str) -> str:
     return title
 
 
+def _message_records(
+    messages: Iterable[ConversationMessage],
+) -> Iterator[Tuple[str, Any, Optional[str], Optional[Dict[str, int]], str]]:
+    """Adapt parsed messages to the records _build_metadata() consumes."""
+    for m in messages:
+        yield m.type, m.timestamp, m.model, m.token_usage, m.content
+
+
 class SessionParser:
     """Parser for Claude Code session data files."""
 
@@ -100,63 +186,250 @@ class SessionParser:
         self.history_file = self.claude_dir / "history.jsonl"
         self.stats_file = self.claude_dir / "stats-cache.json"
         self.todos_dir = self.claude_dir / "todos"
+        self._session_files = SessionFileIndex(self.projects_dir)
 
-    def get_all_sessions(self) -> List[SessionMetadata]:
-        """Get all sessions with metadata, sorted by last activity."""
-        sessions = []
-        seen_ids = set()
+        # file path -> (mtime_ns, size, metadata), least recently used first
+        self._meta_cache: "OrderedDict[str, Tuple[int, int, Optional[SessionMetadata]]]" = OrderedDict()
+        self._meta_lock = threading.Lock()
 
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
+        # file path -> ((mtime_ns, size), lowercased file bytes), filled by
+        # content search and validated against the metadata cache's stat key
+        self._content_cache: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._content_bytes = 0
 
-            for session_file in project_dir.glob("*.jsonl"):
-                # Skip agent files
-                if session_file.stem.startswith("agent-"):
-                    continue
+        # (stats file key, monotonic time, stats) from the last get_stats()
+        self._stats_cache: Optional[Tuple[tuple, float, SessionStats]] = None
+
+        # session file -> (cache key, bundle), least recently used first
+        self._bundles: "OrderedDict[Path, Tuple[tuple, SessionBundle]]" = OrderedDict()
+        self._bundle_lock = threading.Lock()
+
+    def warmup(self) -> None:
+        """Load the saved metadata cache and build the session file index."""
+        self.load_meta_cache()
+        self._session_files.refresh()
 
-                session_id = session_file.stem
-                if session_id in seen_ids:
+    def load_meta_cache(self, path: Path = META_CACHE_PATH) -> None:
+        """Restore metadata saved by save_meta_cache()."""
+        try:
+            with open(path, "rb") as f:
+                saved = jsonl.loads(f.read())
+        except (OSError, ValueError):
+            return
+        if type(saved) is not dict or saved.get("version") != META_CACHE_VERSION:
+            return
+
+        fields = SessionMetadata.model_fields.keys()
+        restored = []
+        for entry in saved.get("entries") or ():
+            try:
+                key, mtime_ns, size, data = entry
+                # Entries from an older SessionMetadata are re-parsed instead
+                if data is None:
+                    metadata = None
+                elif data.keys() == fields:
+                    metadata = SessionMetadata.model_validate(data)
+                else:
                     continue
-                seen_ids.add(session_id)
+            except Exception:
+                continue
+            restored.append((key, (mtime_ns, size, metadata)))
+
+        with self._meta_lock:
+            for key, entry in restored:
+                self._meta_cache.setdefault(key, entry)
+            while len(self._meta_cache) > META_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+
+    def save_meta_cache(self, path: Path = META_CACHE_PATH) -> None:
+        """Write the metadata cache to disk for the next run."""
+        with self._meta_lock:
+            entries = [
+                [key, mtime_ns, size, metadata.model_dump(mode="json") if metadata else None]
+                for key, (mtime_ns, size, metadata) in self._meta_cache.items()
+            ]
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": META_CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error saving session metadata cache: {e}")
 
-                metadata = self._parse_session_metadata(session_file, project_dir.name)
-                if metadata:
-                    sessions.append(metadata)
+    def iter_session_files(self) -> Iterator[Tuple[Path, str]]:
+        """Yield (session file, project name) once per session ID."""
+        seen_ids = set()
+        for session_id, file_path, project_name in scan_session_files(self.projects_dir):
+            if session_id in seen_ids:
+                continue
+            seen_ids.add(session_id)
+            yield Path(file_path), project_name
 
-        return sorted(sessions, key=lambda s: s.last_activity, reverse=True)
+    def parse_metadata_cached(
+        self, file_path: Path, project_name: Optional[str] = None
+    ) -> Optional[SessionMetadata]:
+        """Get metadata for one session file, reusing the metadata cache."""
+        return self._parse_session_metadata(
+            file_path, project_name or file_path.parent.name
+        )
+
+    def _iter_metadata(self) -> Iterator[SessionMetadata]:
+        """Yield metadata for every session file, in scan order."""
+        for file_path, project_name in self.iter_session_files():
+            metadata = self.parse_metadata_cached(file_path, project_name)
+            if metadata:
+                yield metadata
+
+    def get_all_sessions(self) -> List[SessionMetadata]:
+        """Get all sessions with metadata, sorted by last activity."""
+        return sorted(
+            self._iter_metadata(), key=lambda s: s.last_activity, reverse=True
+        )
+
+    def top_k_by_activity(self, k: int) -> List[SessionMetadata]:
+        """Get the k sessions with the latest last_activity, newest first."""
+        return heapq.nlargest(
+            k, self._iter_metadata(), key=lambda s: s.last_activity
+        )
+
+    def get_recent_sessions_and_ids(
+        self, k: int = 20
+    ) -> Tuple[List[SessionMetadata], Set[str]]:
+        """Get the k most recently active sessions plus all live session IDs."""
+        candidates = []
+        for file_path, project_name in self.iter_session_files():
+            try:
+                mtime = file_path.stat().st_mtime
+            except OSError:
+                continue
+            candidates.append((mtime, file_path, project_name))
+        # mtime tracks last_activity for append-only session files, so only
+        # about k of them need parsing
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        sessions = []
+        session_ids = {file_path.stem for _, file_path, _ in candidates}
+        for _, file_path, project_name in candidates:
+            if len(sessions) >= k:
+                break
+            metadata = self.parse_metadata_cached(file_path, project_name)
+            if metadata:
+                sessions.append(metadata)
+            else:
+                # Unparseable files count as gone, like in get_all_sessions()
+                session_ids.discard(file_path.stem)
+
+        sessions.sort(key=lambda s: s.last_activity, reverse=True)
+        return sessions, session_ids
+
+    def get_sessions_page(
+        self, offset: int = 0, limit: int = 50
+    ) -> Tuple[List[SessionMetadata], int]:
+        """Get one page of sessions by last activity, plus the total count."""
+        sessions = list(self._iter_metadata())
+        page = heapq.nlargest(
+            offset + limit, sessions, key=lambda s: s.last_activity
+        )
+        return page[offset:], len(sessions)
 
     def _parse_session_metadata(
         self, file_path: Path, project_name: str
     ) -> Optional[SessionMetadata]:
-        """Parse a session JSONL file to extract metadata."""
+        """Parse a session JSONL file to extract metadata, cached per (mtime, size)."""
         try:
-            messages = list(self._stream_messages(file_path))
-            if not messages:
-                return None
+            st = os.stat(file_path)
+        except OSError:
+            return None
 
-            # Extract timestamps
-            timestamps = [m.timestamp for m in messages]
-            start_time = min(timestamps)
-            last_activity = max(timestamps)
+        key = str(file_path)
+        with self._meta_lock:
+            cached = self._meta_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._meta_cache.move_to_end(key)
+                metadata = cached[2]
+                return metadata.model_copy() if metadata else None
 
-            # Count messages
-            user_count = sum(1 for m in messages if m.type == "user")
-            assistant_count = sum(1 for m in messages if m.type == "assistant")
+        metadata = self._build_metadata(
+            file_path, project_name, self._stream_metadata_records(file_path)
+        )
 
-            # Find model and tokens
+        with self._meta_lock:
+            self._meta_cache[key] = (st.st_mtime_ns, st.st_size, metadata)
+            self._meta_cache.move_to_end(key)
+            while len(self._meta_cache) > META_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+        return metadata.model_copy() if metadata else None
+
+    def _build_metadata(
+        self,
+        file_path: Path,
+        project_name: str,
+        records: Iterable[Tuple[str, Any, Optional[str], Optional[Dict[str, int]], str]],
+    ) -> Optional[SessionMetadata]:
+        """Build session metadata in a single pass over message records."""
+        try:
+            first_iso = last_iso = None  # uniform "...Z" timestamp strings
+            iso_len = 0
+            start_time = None  # everything else, parsed
+            last_activity = None
+            message_count = 0
+            user_count = 0
+            assistant_count = 0
             model_used = None
             total_input = 0
             total_output = 0
-            for m in messages:
-                if m.model:
-                    model_used = m.model
-                if m.token_usage:
-                    total_input += m.token_usage.get("input_tokens", 0)
-                    total_output += m.token_usage.get("output_tokens", 0)
+            summaries: List[str] = []
+            first_user_msg = None
+            all_paste_types: set = set()
+            has_pasted = False
+
+            for msg_type, ts, model, token_usage, text in records:
+                message_count += 1
+                if not iso_len and type(ts) is str and ts[-1:] == "Z":
+                    iso_len = len(ts)
+                if _is_utc_iso(ts, iso_len):
+                    if first_iso is None or ts < first_iso:
+                        first_iso = ts
+                    if last_iso is None or ts > last_iso:
+                        last_iso = ts
+                else:
+                    if not isinstance(ts, datetime):
+                        ts = _parse_timestamp(ts)
+                    if start_time is None or ts < start_time:
+                        start_time = ts
+                    if last_activity is None or ts > last_activity:
+                        last_activity = ts
+
+                if model:
+                    model_used = model
+                if token_usage:
+                    total_input += token_usage.get("input_tokens", 0)
+                    total_output += token_usage.get("output_tokens", 0)
+
+                if msg_type == "user":
+                    user_count += 1
+                    if first_user_msg is None:
+                        first_user_msg = text
+                    # Detect pasted content across all user messages
+                    ptypes = _detect_pasted_content(text)
+                    if ptypes:
+                        has_pasted = True
+                        all_paste_types.update(ptypes)
+                elif msg_type == "assistant":
+                    assistant_count += 1
+                elif msg_type == "summary" and len(summaries) < 3:
+                    summaries.append(text)  # Keep first 3 summaries
+
+            if not message_count:
+                return None
 
-            # Extract summaries
-            summaries = [m.content for m in messages if m.type == "summary"]
+            if first_iso is not None:
+                first_dt = _parse_timestamp(first_iso)
+                last_dt = _parse_timestamp(last_iso)
+                if start_time is None or first_dt < start_time:
+                    start_time = first_dt
+                if last_activity is None or last_dt > last_activity:
+                    last_activity = last_dt
 
             # Decode project path
             project_path = project_name.replace("-", "/")
@@ -164,31 +437,20 @@ class SessionParser:
                 project_path = "/" + project_path
 
             # Generate title from first user message
-            user_messages = [m for m in messages if m.type == "user"]
-            first_user_msg = user_messages[0].content if user_messages else ""
             title = _generate_title(first_user_msg) if first_user_msg else None
 
-            # Detect pasted content across all user messages
-            all_paste_types: set = set()
-            has_pasted = False
-            for m in user_messages:
-                ptypes = _detect_pasted_content(m.content)
-                if ptypes:
-                    has_pasted = True
-                    all_paste_types.update(ptypes)
-
             return SessionMetadata(
                 session_id=file_path.stem,
                 project_path=project_path,
                 start_time=start_time,
                 last_activity=last_activity,
-                message_count=len(messages),
+                message_count=message_count,
                 user_message_count=user_count,
                 assistant_message_count=assistant_count,
                 model_used=model_used,
                 total_input_tokens=total_input,
                 total_output_tokens=total_output,
-                summaries=summaries[:3],  # Keep first 3 summaries
+                summaries=summaries,
                 file_path=str(file_path),
                 title=title,
                 first_user_message=first_user_msg[:500] if first_user_msg else None,
@@ -199,36 +461,68 @@ class SessionParser:
             print(f"Error parsing {file_path}: {e}")
             return None
 
+    def _stream_metadata_records(
+        self, file_path: Path
+    ) -> Iterator[Tuple[str, Any, Optional[str], Optional[Dict[str, int]], str]]:
+        """Stream (type, timestamp, model, token_usage, text) per message."""
+        for line in jsonl.iter_lines(file_path):
+            try:
+                obj = jsonl.loads(line)
+            except jsonl.JSONDecodeError:
+                continue  # corrupt line
+
+            msg_type = obj.get("type")
+            if msg_type == "summary":
+                yield msg_type, obj.get("timestamp"), None, None, obj.get("summary", "")
+                continue
+            if msg_type != "user" and msg_type != "assistant":
+                continue
+
+            message = obj.get("message", {})
+            raw_content = message.get("content", "")
+            if msg_type == "assistant":
+                usage = message.get("usage")
+                token_usage = None
+                if usage:
+                    token_usage = {
+                        "input_tokens": usage.get("input_tokens", 0),
+                        "output_tokens": usage.get("output_tokens", 0),
+                    }
+                yield msg_type, obj.get("timestamp"), message.get("model"), token_usage, ""
+                continue
+
+            if isinstance(raw_content, str):
+                text = raw_content
+            elif isinstance(raw_content, list):
+                text = "\n".join(
+                    block.get("text", "")
+                    for block in raw_content
+                    if isinstance(block, dict) and block.get("type") == "text"
+                )
+            else:
+                text = ""
+            yield msg_type, obj.get("timestamp"), None, None, text
+
     def _stream_messages(self, file_path: Path) -> Iterator[ConversationMessage]:
         """Stream messages from a session JSONL file."""
-        with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    msg = self._parse_message(obj)
-                    if msg:
-                        yield msg
-                except json.JSONDecodeError:
-                    continue
+        for line in jsonl.iter_lines(file_path):
+            try:
+                obj = jsonl.loads(line)
+            except jsonl.JSONDecodeError:
+                continue  # corrupt line
+            msg = self._parse_message(obj)
+            if msg:
+                yield msg
 
     def _parse_message(self, obj: Dict[str, Any]) -> Optional[ConversationMessage]:
         """Parse a single message object."""
-        msg_type = obj.get("type")
-        if msg_type not in ("user", "assistant", "summary"):
+        get = obj.get
+        msg_type = get("type")
+        if msg_type not in _MESSAGE_TYPES:
             return None
 
         # Parse timestamp
-        ts_str = obj.get("timestamp")
-        if ts_str:
-            try:
-                timestamp = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-            except ValueError:
-                timestamp = datetime.now()
-        else:
-            timestamp = datetime.now()
+        timestamp = _parse_timestamp(get("timestamp"))
 
         # Extract content
         content = ""
@@ -239,35 +533,33 @@ class SessionParser:
         token_usage = None
 
         if msg_type == "summary":
-            content = obj.get("summary", "")
+            content = get("summary", "")
         else:
-            message = obj.get("message", {})
+            message = get("message", {})
             raw_content = message.get("content", "")
 
-            if isinstance(raw_content, str):
+            if type(raw_content) is str:
                 content = raw_content
-            elif isinstance(raw_content, list):
+            elif type(raw_content) is list:
                 text_parts = []
                 for block in raw_content:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                        elif block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            tool_input = block.get("input", {})
-                            tool_calls.append(
-                                {
-                                    "name": tool_name,
-                                    "id": block.get("id"),
-                                }
+                    if type(block) is not dict:
+                        continue
+                    block_type = block.get("type")
+                    if block_type == "text":
+                        text_parts.append(block.get("text", ""))
+                    elif block_type == "tool_use":
+                        tool_name = block.get("name", "")
+                        tool_id = block.get("id")
+                        tool_calls.append({"name": tool_name, "id": tool_id})
+                        # Extract rich tool details
+                        tool_details.append(
+                            self._extract_tool_detail(
+                                tool_name, block.get("input", {}), tool_id
                             )
-                            # Extract rich tool details
-                            detail = self._extract_tool_detail(
-                                tool_name, tool_input, block.get("id")
-                            )
-                            tool_details.append(detail)
-                        elif block.get("type") == "thinking":
-                            thinking = block.get("thinking", "")
+                        )
+                    elif block_type == "thinking":
+                        thinking = block.get("thinking", "")
                 content = "\n".join(text_parts)
 
             if msg_type == "assistant":
@@ -280,8 +572,8 @@ class SessionParser:
                     }
 
         return ConversationMessage(
-            uuid=obj.get("uuid", ""),
-            parent_uuid=obj.get("parentUuid"),
+            uuid=get("uuid", ""),
+            parent_uuid=get("parentUuid"),
             type=msg_type,
             timestamp=timestamp,
             content=content,
@@ -290,7 +582,7 @@ class SessionParser:
             thinking=thinking,
             model=model,
             token_usage=token_usage,
-            is_sidechain=obj.get("isSidechain", False),
+            is_sidechain=get("isSidechain", False),
         )
 
     def _extract_tool_detail(
@@ -357,10 +649,19 @@ class SessionParser:
         if not session_file:
             return []
 
-        messages = list(self._stream_messages(session_file))
+        bundle = self._cached_bundle(session_id, session_file)
+        messages = bundle.messages if bundle else self._stream_messages(session_file)
         # Filter to only user and assistant messages
-        messages = [m for m in messages if m.type in ("user", "assistant")]
-        return messages[offset : offset + limit]
+        page = islice(
+            (m for m in messages if m.type in ("user", "assistant")),
+            offset,
+            offset + limit,
+        )
+        try:
+            return list(page)
+        except Exception as e:
+            print(f"Error parsing {session_file}: {e}")
+            return []
 
     def get_conversation_tree(self, session_id: str) -> ConversationTree:
         """Build a tree-structured view of the conversation.
@@ -369,25 +670,11 @@ class SessionParser:
         detects branches where the conversation forked, and builds
         a collapsible tree structure.
         """
-        session_file = self._find_session_file(session_id)
-        if not session_file:
+        bundle = self.get_session_bundle(session_id)
+        if not bundle:
             return ConversationTree()
 
-        # Parse all messages with full metadata
-        all_msgs = []
-        with open(session_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    msg = self._parse_message(obj)
-                    if msg and msg.type in ("user", "assistant"):
-                        all_msgs.append(msg)
-                except (json.JSONDecodeError, Exception):
-                    continue
-
+        all_msgs = [m for m in bundle.messages if m.type in ("user", "assistant")]
         if not all_msgs:
             return ConversationTree()
 
@@ -516,13 +803,7 @@ class SessionParser:
 
     def _find_session_file(self, session_id: str) -> Optional[Path]:
         """Find the session file for a given session ID."""
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            session_file = project_dir / f"{session_id}.jsonl"
-            if session_file.exists():
-                return session_file
-        return None
+        return self._session_files.find(session_id)
 
     def get_session(self, session_id: str) -> Optional[SessionMetadata]:
         """Get metadata for a specific session."""
@@ -530,23 +811,74 @@ class SessionParser:
         if not session_file:
             return None
 
-        project_name = session_file.parent.name
-        return self._parse_session_metadata(session_file, project_name)
+        return self.parse_metadata_cached(session_file)
 
-    def get_session_todos(self, session_id: str) -> List[TodoItem]:
-        """Get todos for a session."""
+    def get_session_bundle(self, session_id: str) -> Optional[SessionBundle]:
+        """Get a session's metadata, messages and todos from one file read."""
+        session_file = self._find_session_file(session_id)
+        if not session_file:
+            return None
+
+        key = self._bundle_key(session_id, session_file)
+        bundle = self._cached_bundle(session_id, session_file, key)
+        if bundle:
+            return bundle
+
+        try:
+            messages = list(self._stream_messages(session_file))
+        except Exception as e:
+            print(f"Error parsing {session_file}: {e}")
+            return None
+
+        bundle = SessionBundle(
+            metadata=self._build_metadata(
+                session_file, session_file.parent.name, _message_records(messages)
+            ),
+            messages=tuple(messages),
+            todos=tuple(self.get_session_todos(session_id)),
+        )
+        with self._bundle_lock:
+            self._bundles[session_file] = (key, bundle)
+            self._bundles.move_to_end(session_file)
+            while len(self._bundles) > BUNDLE_CACHE_SIZE:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def _bundle_key(self, session_id: str, session_file: Path) -> tuple:
+        """Cache key for a bundle: stat keys of the session and todo files."""
+        return (
+            _stat_key(session_file),
+            tuple(_stat_key(p) for p in self._todo_files(session_id)),
+        )
+
+    def _cached_bundle(
+        self, session_id: str, session_file: Path, key: Optional[tuple] = None
+    ) -> Optional[SessionBundle]:
+        """The cached bundle for a session if still current, else None."""
+        if key is None:
+            key = self._bundle_key(session_id, session_file)
+        with self._bundle_lock:
+            cached = self._bundles.get(session_file)
+            if cached and cached[0] == key:
+                self._bundles.move_to_end(session_file)
+                return cached[1]
+        return None
+
+    def _todo_files(self, session_id: str) -> List[Path]:
+        """Candidate todo files for a session, in lookup order."""
         # Try different naming patterns
-        patterns = [
-            f"{session_id}-agent-{session_id}.json",
-            f"{session_id}.json",
+        return [
+            self.todos_dir / f"{session_id}-agent-{session_id}.json",
+            self.todos_dir / f"{session_id}.json",
         ]
 
-        for pattern in patterns:
-            todo_file = self.todos_dir / pattern
+    def get_session_todos(self, session_id: str) -> List[TodoItem]:
+        """Get todos for a session."""
+        for todo_file in self._todo_files(session_id):
             if todo_file.exists():
                 try:
-                    with open(todo_file) as f:
-                        todos_data = json.load(f)
+                    with open(todo_file, "rb") as f:
+                        todos_data = jsonl.loads(f.read())
                     if isinstance(todos_data, list):
                         return [
                             TodoItem(
@@ -562,6 +894,26 @@ class SessionParser:
 
     def get_stats(self) -> SessionStats:
         """Get aggregated statistics."""
+        stats_key = _stat_key(self.stats_file)
+        ttl = None
+        if stats_key is None:
+            stats_key = ("computed", _stat_key(self.projects_dir))
+            ttl = STATS_TTL_SECONDS
+
+        cached = self._stats_cache
+        if (
+            cached is not None
+            and cached[0] == stats_key
+            and (ttl is None or time.monotonic() - cached[1] < ttl)
+        ):
+            return cached[2].model_copy()
+
+        stats = self._load_stats()
+        self._stats_cache = (stats_key, time.monotonic(), stats)
+        return stats.model_copy()
+
+    def _load_stats(self) -> SessionStats:
+        """Read stats-cache.json, or compute stats from the sessions."""
         if not self.stats_file.exists():
             # Calculate from sessions if no cache
             sessions = self.get_all_sessions()
@@ -571,8 +923,8 @@ class SessionParser:
             )
 
         try:
-            with open(self.stats_file) as f:
-                data = json.load(f)
+            with open(self.stats_file, "rb") as f:
+                data = jsonl.loads(f.read())
 
             return SessionStats(
                 total_sessions=data.get("totalSessions", 0),
@@ -585,14 +937,51 @@ class SessionParser:
         except Exception:
             return SessionStats()
 
+    def _lowered_content(self, file_path: str) -> bytes:
+        """A session file's bytes with ASCII letters lowercased."""
+        with self._meta_lock:
+            meta = self._meta_cache.get(file_path)
+            stat_key = (meta[0], meta[1]) if meta else None
+            cached = self._content_cache.get(file_path)
+            if cached and stat_key and cached[0] == stat_key:
+                self._content_cache.move_to_end(file_path)
+                return cached[1]
+
+        with open(file_path, "rb") as f:
+            lowered = f.read().lower()
+
+        if stat_key and len(lowered) <= CONTENT_CACHE_BYTES // 4:
+            with self._meta_lock:
+                old = self._content_cache.pop(file_path, None)
+                if old:
+                    self._content_bytes -= len(old[1])
+                self._content_cache[file_path] = (stat_key, lowered)
+                self._content_bytes += len(lowered)
+                while self._content_bytes > CONTENT_CACHE_BYTES:
+                    _, (_, evicted) = self._content_cache.popitem(last=False)
+                    self._content_bytes -= len(evicted)
+        return lowered
+
     def search_sessions(
-        self, query: str, search_content: bool = False
+        self,
+        query: str,
+        search_content: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[SessionMetadata]:
         """Search sessions by summaries or content."""
         query_lower = query.lower()
         results = []
+        stop_at = offset + limit if limit is not None else None
+
+        # ASCII queries are matched against cached lowercased file bytes;
+        # bytes.lower() only folds ASCII, so other queries decode the file
+        needle = query_lower.encode() if query.isascii() else None
 
         for session in self.get_all_sessions():
+            if stop_at is not None and len(results) >= stop_at:
+                break
+
             # Search in summaries
             if any(query_lower in s.lower() for s in session.summaries):
                 results.append(session)
@@ -606,11 +995,14 @@ class SessionParser:
             # Optionally search in message content
             if search_content and session.file_path:
                 try:
-                    with open(session.file_path) as f:
-                        content = f.read().lower()
-                    if query_lower in content:
+                    if needle is not None:
+                        found = needle in self._lowered_content(session.file_path)
+                    else:
+                        with open(session.file_path, "rb") as f:
+                            found = query_lower in f.read().decode("utf-8").lower()
+                    if found:
                         results.append(session)
                 except Exception:
                     pass
 
-        return results
+        return results[offset:]
@@ -1,5 +1,8 @@
+import asyncio
 import json
+import threading
 from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -15,11 +18,53 @@ from .data.archive import SessionArchive
 from .data.history_reader import get_all_session_history
 from .data.semantic_index import SemanticIndex
 from .config import settings
+from .services.context_generator import ContextGenerator
+
+
+def _warm_up():
+    """Build the search index and prime caches before the first request."""
+    if search_index.is_stale():
+        search_index.build_index()
+    # Update which archived sessions are still live
+    archive._mark_gone_sessions()
+
+    parser.warmup()
+    artifact_parser.warmup()
+    detector.snapshot()
+
+
+def _auto_describe():
+    """Generate descriptions for recent sessions that are missing one."""
+    from .services.session_describer import describe_session, get_cached_description
+    try:
+        sessions = parser.get_all_sessions()
+        for s in sessions[:30]:  # Cap at 30 per startup to avoid long blocks
+            if not get_cached_description(s.session_id):
+                try:
+                    describe_session(s.session_id, parser)
+                except Exception:
+                    continue
+    except Exception:
+        pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up off the event loop, then serve."""
+    await asyncio.to_thread(_warm_up)
+
+    # Auto-generate descriptions for sessions missing them (runs in background)
+    threading.Thread(target=_auto_describe, daemon=True).start()
+    yield
+
+    await asyncio.to_thread(parser.save_meta_cache)
+
 
 app = FastAPI(
     title="Claude Desk",
     description="View and manage UI for Claude Code",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 # Mount static files
@@ -41,31 +86,13 @@ artifact_parser = ArtifactParser()
 search_index = SearchIndex()
 archive = SessionArchive()
 semantic_index = SemanticIndex()
+context_gen = ContextGenerator(parser, detector)
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Build search index on startup."""
-    if search_index.is_stale():
-        search_index.build_index()
-    # Update which archived sessions are still live
-    archive._mark_gone_sessions()
-
-    # Auto-generate descriptions for sessions missing them (runs in background)
-    import threading
-    def _auto_describe():
-        from .services.session_describer import describe_session, get_cached_description
-        try:
-            sessions = parser.get_all_sessions()
-            for s in sessions[:30]:  # Cap at 30 per startup to avoid long blocks
-                if not get_cached_description(s.session_id):
-                    try:
-                        describe_session(s.session_id, parser)
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-    threading.Thread(target=_auto_describe, daemon=True).start()
+# Share these instances (and their caches) with the API routes
+app.state.parser = parser
+app.state.detector = detector
+app.state.artifact_parser = artifact_parser
+app.state.context_gen = context_gen
 
 
 def format_duration(minutes: int) -> str:
@@ -126,9 +153,9 @@ def _archived_to_metadata(a: dict) -> SessionMetadata:
 
 def _get_all_sessions_unified(limit: int = 200) -> list:
     """Get ALL sessions ever — live JSONL + archived DB + history.jsonl metadata."""
-    # 1. Live sessions (have JSONL files)
-    live = parser.get_all_sessions()
-    seen_ids = {s.session_id for s in live}
+    # 1. Live sessions (have JSONL files); only the newest `limit` can make
+    # the cut, but every live ID must keep its archived copy out
+    live, seen_ids = parser.get_recent_sessions_and_ids(limit)
 
     # 2. Archived sessions (JSONL deleted but we saved content)
     archived = archive.get_archived_only(limit=500)
@@ -158,11 +185,10 @@ def _get_all_sessions_unified(limit: int = 200) -> list:
 
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
+def dashboard(request: Request):
     """Main dashboard page — shows live + archived sessions unified."""
     sessions = _get_all_sessions_unified(limit=20)
-    active_ids = set(detector.get_active_sessions())
-    latest_id = detector.get_latest_session_id()
+    active_ids, latest_id = detector.snapshot()
 
     for session in sessions:
         session.is_active = session.session_id in active_ids
@@ -230,7 +256,7 @@ async def dashboard(request: Request):
 
 
 @app.get("/timeline", response_class=HTMLResponse)
-async def timeline(request: Request, view: str = "topics"):
+def timeline(request: Request, view: str = "topics"):
     """Timeline view — all sessions grouped by day, with topic extraction.
 
     view=topics (default): Groups by topic clusters within each day
@@ -239,7 +265,7 @@ async def timeline(request: Request, view: str = "topics"):
     from .services.topic_extractor import extract_session_topics_summary, cluster_topics_across_sessions
 
     sessions = _get_all_sessions_unified(limit=200)
-    active_ids = set(detector.get_active_sessions())
+    active_ids = detector.get_active_sessions_set()
     fav_ids = {f["session_id"] for f in favorites.get_favorites()}
 
     for session in sessions:
@@ -291,7 +317,7 @@ async def timeline(request: Request, view: str = "topics"):
 
 
 @app.get("/sessions", response_class=HTMLResponse)
-async def sessions_list(request: Request, page: int = 1, q: str = "", mode: str = "sessions"):
+def sessions_list(request: Request, page: int = 1, q: str = "", mode: str = "sessions"):
     """Session list page with FTS search. Includes archived sessions.
 
     mode=sessions (default): session-level results
@@ -372,15 +398,17 @@ async def sessions_list(request: Request, page: int = 1, q: str = "", mode: str
     else:
         sessions = _get_all_sessions_unified(limit=200)
 
-    active_ids = set(detector.get_active_sessions())
+    active_ids = detector.get_active_sessions_set()
     fav_ids = {f["session_id"] for f in favorites.get_favorites()}
-    for session in sessions:
-        session.is_active = session.session_id in active_ids
 
     total = len(sessions)
     paginated_sessions = sessions[offset : offset + page_size]
     total_pages = (total + page_size - 1) // page_size
 
+    # Only the rendered page needs active flags
+    for session in paginated_sessions:
+        session.is_active = session.session_id in active_ids
+
     # Semantic index stats for UI
     sem_stats = semantic_index.get_stats()
     sem_stats["is_stale"] = semantic_index.is_stale()
@@ -424,15 +452,16 @@ async def sessions_list(request: Request, page: int = 1, q: str = "", mode: str
 
 
 @app.get("/sessions/{session_id}", response_class=HTMLResponse)
-async def session_detail(request: Request, session_id: str):
+def session_detail(request: Request, session_id: str):
     """Session detail page. Falls back to archive if JSONL is gone."""
-    session = parser.get_session(session_id)
+    bundle = parser.get_session_bundle(session_id)
+    session = bundle.metadata.model_copy() if bundle and bundle.metadata else None
     from_archive = False
 
     if session:
         session.is_active = detector.is_session_active(session_id)
         conv_tree = parser.get_conversation_tree(session_id)
-        todos = parser.get_session_todos(session_id)
+        todos = list(bundle.todos)
     else:
         # Try archive
         archived = archive.get_archived_session(session_id)
@@ -560,7 +589,7 @@ async def session_detail(request: Request, session_id: str):
 
 
 @app.get("/sessions/{session_id}/markdown", response_class=PlainTextResponse)
-async def session_markdown(request: Request, session_id: str):
+def session_markdown(request: Request, session_id: str):
     """Export session as markdown."""
     session = parser.get_session(session_id)
     if not session:
@@ -611,9 +640,8 @@ async def session_markdown(request: Request, session_id: str):
 
 
 @app.get("/sessions/{session_id}/context", response_class=HTMLResponse)
-async def session_context(request: Request, session_id: str):
+def session_context(request: Request, session_id: str):
     """Context export page."""
-    from .services.context_generator import ContextGenerator
 
     session = parser.get_session(session_id)
     if not session:
@@ -623,7 +651,6 @@ async def session_context(request: Request, session_id: str):
             status_code=404,
         )
 
-    context_gen = ContextGenerator(parser, detector)
     context = context_gen.generate_context(session_id)
 
     return templates.TemplateResponse(
@@ -640,7 +667,7 @@ async def session_context(request: Request, session_id: str):
 
 
 @app.post("/api/resume/{session_id}")
-async def resume_session(session_id: str):
+def resume_session(session_id: str):
     """Open Terminal.app and run claude --resume for this session."""
     import subprocess
     cmd = f'claude --resume {session_id}'
@@ -736,7 +763,7 @@ async def apply_playbook(request: Request):
 
 
 @app.post("/api/favorites/{session_id}/toggle")
-async def toggle_favorite(session_id: str):
+def toggle_favorite(session_id: str):
     """Toggle favorite status for a session."""
     new_state = favorites.toggle_favorite(session_id)
     return JSONResponse({"favorited": new_state, "session_id": session_id})
@@ -758,7 +785,7 @@ async def pin_session(session_id: str, request: Request):
 
 
 @app.post("/api/describe/{session_id}")
-async def describe_session_api(session_id: str):
+def describe_session_api(session_id: str):
     """Generate an LLM description for a session."""
     from .services.session_describer import describe_session
     try:
@@ -774,12 +801,17 @@ async def describe_batch_api(request: Request):
     from .services.session_describer import describe_session
     body = await request.json()
     session_ids = body.get("session_ids", [])[:20]  # Cap at 20
-    results = {}
-    for sid in session_ids:
-        try:
-            results[sid] = describe_session(sid, parser)
-        except Exception:
-            results[sid] = "Description unavailable."
+
+    def _describe_all() -> dict:
+        results = {}
+        for sid in session_ids:
+            try:
+                results[sid] = describe_session(sid, parser)
+            except Exception:
+                results[sid] = "Description unavailable."
+        return results
+
+    results = await asyncio.to_thread(_describe_all)
     return JSONResponse({"ok": True, "descriptions": results})
 
 
@@ -792,14 +824,14 @@ async def build_semantic_index(request: Request):
     body = await request.json() if request.headers.get("content-type") == "application/json" else {}
     force = body.get("force", False)
     try:
-        stats = semantic_index.build_index(force=force)
+        stats = await asyncio.to_thread(semantic_index.build_index, force=force)
         return JSONResponse({"ok": True, **stats})
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=500)
 
 
 @app.get("/api/semantic/stats")
-async def semantic_stats():
+def semantic_stats():
     """Get semantic index statistics."""
     return JSONResponse(semantic_index.get_stats())
 
@@ -813,14 +845,14 @@ async def semantic_search_api(request: Request):
     if not query:
         return JSONResponse({"error": "No query"}, status_code=400)
     try:
-        results = semantic_index.search(query, top_k=top_k)
+        results = await asyncio.to_thread(semantic_index.search, query, top_k=top_k)
         return JSONResponse({"results": results, "total": len(results), "query": query})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
 @app.get("/insights", response_class=HTMLResponse)
-async def insights_page(request: Request, days: int = 7):
+def insights_page(request: Request, days: int = 7):
     """Cross-conversation insights and cost analysis."""
     from .services.insights import (
         calculate_period_costs, analyze_cross_session_patterns,
@@ -862,7 +894,7 @@ async def insights_page(request: Request, days: int = 7):
 
 
 @app.get("/skills", response_class=HTMLResponse)
-async def skills_page(request: Request):
+def skills_page(request: Request):
     """Skills browser — all commands and skills from user + plugins."""
     from .services.skill_scanner import scan_skills, group_by_source, get_stats
 
@@ -881,7 +913,7 @@ async def skills_page(request: Request):
 
 
 @app.get("/visualize", response_class=HTMLResponse)
-async def visualize_page(request: Request):
+def visualize_page(request: Request):
     """Rich visualizations — 3D terrain + constellation scatter."""
     return templates.TemplateResponse(
         "visualize.html",
@@ -890,7 +922,7 @@ async def visualize_page(request: Request):
 
 
 @app.get("/artifacts", response_class=HTMLResponse)
-async def artifacts_list(request: Request, file_type: str = "", session_id: str = ""):
+def artifacts_list(request: Request, file_type: str = "", session_id: str = ""):
     """Artifacts listing page."""
     artifacts = artifact_parser.get_all_artifacts(limit=200)
 
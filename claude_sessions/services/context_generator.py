@@ -5,6 +5,10 @@ from ..data.models import SessionContext, ConversationMessage, TodoItem
 from ..data.session_parser import SessionParser
 from ..data.active_detector import ActiveSessionDetector
 
+# Tools whose file_path input counts as a file the session worked on. Glob is
+# left out: its path input is the directory searched, not a file.
+_FILE_TOOLS = frozenset(("Read", "Write", "Edit"))
+
 
 class ContextGenerator:
     """Generate context summaries for session continuation."""
@@ -71,16 +75,16 @@ class ContextGenerator:
     def _extract_file_references(
         self, messages: List[ConversationMessage]
     ) -> List[str]:
-        """Extract unique file paths from tool calls."""
-        files = set()
-        for msg in messages:
-            for tool in msg.tool_calls:
-                name = tool.get("name", "")
-                if name in ("Read", "Write", "Edit", "Glob"):
-                    # We don't have the full tool input here, but we could
-                    # parse it from the raw message if needed
-                    pass
-        return list(files)
+        """Extract unique file paths from tool calls, in first-use order."""
+        # dict.fromkeys dedupes while keeping insertion order
+        return list(
+            dict.fromkeys(
+                detail.file_path
+                for msg in messages
+                for detail in msg.tool_details
+                if detail.file_path and detail.name in _FILE_TOOLS
+            )
+        )
 
     def _build_summary(
         self, session, messages: List[ConversationMessage]